@@ -0,0 +1,175 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+# distutils: libraries = crypto
+"""
+_clockke_verify.pyx
+Shunyaya Symbolic Mathematical Clock Kernel (SSM-ClockKe)
+
+Optional compiled scanner for clockke_verify_v2_1.py (SHA-256 chains).
+Build it next to the verifier with:
+    cythonize -i scripts/_clockke_verify.pyx
+(needs Cython, a C compiler and the OpenSSL headers / libcrypto).
+
+scan() walks CSV rows straight out of the file buffer: memchr finds line
+and field boundaries and each row is hashed with two OpenSSL EVP contexts
+fed raw pointers into the buffer, so no Python objects are created per row.
+It stops early at the first mismatch or at any line it does not handle
+(quoted fields, too few columns) and hands the rest to the Python loop,
+which then reports or continues exactly as without this module.
+"""
+
+from libc.string cimport memchr, memcmp
+
+cdef extern from "openssl/evp.h" nogil:
+    ctypedef struct EVP_MD_CTX:
+        pass
+    ctypedef struct EVP_MD:
+        pass
+    ctypedef struct ENGINE:
+        pass
+    const EVP_MD *EVP_sha256()
+    EVP_MD_CTX *EVP_MD_CTX_new()
+    void EVP_MD_CTX_free(EVP_MD_CTX *ctx)
+    int EVP_DigestInit_ex(EVP_MD_CTX *ctx, const EVP_MD *type, ENGINE *impl)
+    int EVP_DigestUpdate(EVP_MD_CTX *ctx, const void *d, size_t cnt)
+    int EVP_DigestFinal_ex(EVP_MD_CTX *ctx, unsigned char *md, unsigned int *s)
+
+cdef const char *HEX = b"0123456789abcdef"
+
+# Status codes returned by scan()
+cdef enum:
+    ST_END = 0         # all rows verified
+    ST_MISMATCH = 1    # stopped at a row whose stamp does not match
+    ST_HANDOFF = 2     # stopped at a row left to the Python parser
+
+SCAN_END = ST_END
+SCAN_MISMATCH = ST_MISMATCH
+SCAN_HANDOFF = ST_HANDOFF
+
+cdef inline void _to_hex(const unsigned char *digest, unsigned char *out) noexcept nogil:
+    cdef int i
+    for i in range(32):
+        out[2 * i] = HEX[digest[i] >> 4]
+        out[2 * i + 1] = HEX[digest[i] & 0xF]
+
+cdef inline bint _is_blank(const unsigned char *line, Py_ssize_t length) noexcept nogil:
+    # Same whitespace as bytes.strip(), which the Python loop skips lines by
+    cdef Py_ssize_t i
+    for i in range(length):
+        if line[i] not in b' \t\r\n\v\f':
+            return False
+    return True
+
+def scan(const unsigned char[::1] data, bytes prev_stamp,
+         int i_time, int i_align, int i_band, int i_stamp):
+    """
+    Verify rows of data (CSV body, header already consumed).
+
+    Returns (rows_verified, offset, status, prev_stamp): offset is where
+    the Python loop should resume (len(data) for SCAN_END) and prev_stamp
+    is the stored stamp of the last verified row.
+    """
+    cdef Py_ssize_t n = data.shape[0]
+    cdef const unsigned char *base = &data[0] if n > 0 else NULL
+    cdef Py_ssize_t pos = 0, line_end, next_pos, field_start
+    cdef const unsigned char *p
+    cdef const unsigned char *line
+    cdef Py_ssize_t line_len
+    cdef int n_fields, need, i
+    cdef const unsigned char *f_ptr[64]
+    cdef Py_ssize_t f_len[64]
+    cdef unsigned char digest[32]
+    cdef unsigned char h_hex[64]
+    cdef unsigned char expected[64]
+    cdef unsigned int dlen
+    cdef const unsigned char *prev_ptr = prev_stamp
+    cdef Py_ssize_t prev_len = len(prev_stamp)
+    cdef Py_ssize_t last_start = -1
+    cdef Py_ssize_t count = 0
+    cdef int status = ST_END
+    cdef EVP_MD_CTX *ctx_in
+    cdef EVP_MD_CTX *ctx_out
+    cdef const EVP_MD *md = EVP_sha256()
+
+    need = max(i_time, i_align, i_band, i_stamp) + 1
+    if need > 64:
+        return 0, 0, ST_HANDOFF, prev_stamp
+
+    ctx_in = EVP_MD_CTX_new()
+    ctx_out = EVP_MD_CTX_new()
+    if ctx_in == NULL or ctx_out == NULL:
+        EVP_MD_CTX_free(ctx_in)
+        EVP_MD_CTX_free(ctx_out)
+        raise MemoryError("EVP_MD_CTX_new failed")
+
+    try:
+        with nogil:
+            while pos < n:
+                line = base + pos
+                p = <const unsigned char *>memchr(line, b'\n', n - pos)
+                if p == NULL:
+                    line_end = n
+                    next_pos = n
+                else:
+                    line_end = p - base
+                    next_pos = line_end + 1
+                line_len = line_end - pos
+                if line_len > 0 and line[line_len - 1] == b'\r':
+                    line_len -= 1
+                if _is_blank(line, line_len):
+                    pos = next_pos
+                    continue
+                if memchr(line, b'"', line_len) != NULL:
+                    status = ST_HANDOFF
+                    break
+
+                # Split on commas, keeping only the fields up to the last one needed
+                n_fields = 0
+                field_start = 0
+                while n_fields < need:
+                    p = <const unsigned char *>memchr(line + field_start, b',', line_len - field_start)
+                    f_ptr[n_fields] = line + field_start
+                    if p == NULL:
+                        f_len[n_fields] = line_len - field_start
+                        n_fields += 1
+                        break
+                    f_len[n_fields] = (p - line) - field_start
+                    field_start = (p - line) + 1
+                    n_fields += 1
+                if n_fields < need:
+                    status = ST_HANDOFF
+                    break
+
+                # inner: sha256(time_utc|final_align|band) as hex
+                EVP_DigestInit_ex(ctx_in, md, NULL)
+                EVP_DigestUpdate(ctx_in, f_ptr[i_time], f_len[i_time])
+                EVP_DigestUpdate(ctx_in, b"|", 1)
+                EVP_DigestUpdate(ctx_in, f_ptr[i_align], f_len[i_align])
+                EVP_DigestUpdate(ctx_in, b"|", 1)
+                EVP_DigestUpdate(ctx_in, f_ptr[i_band], f_len[i_band])
+                EVP_DigestFinal_ex(ctx_in, digest, &dlen)
+                _to_hex(digest, h_hex)
+
+                # outer: sha256(prev_stamp || h_payload || time_utc) as hex
+                EVP_DigestInit_ex(ctx_out, md, NULL)
+                EVP_DigestUpdate(ctx_out, prev_ptr, prev_len)
+                EVP_DigestUpdate(ctx_out, h_hex, 64)
+                EVP_DigestUpdate(ctx_out, f_ptr[i_time], f_len[i_time])
+                EVP_DigestFinal_ex(ctx_out, digest, &dlen)
+                _to_hex(digest, expected)
+
+                if f_len[i_stamp] != 64 or memcmp(expected, f_ptr[i_stamp], 64) != 0:
+                    status = ST_MISMATCH
+                    break
+
+                prev_ptr = f_ptr[i_stamp]
+                prev_len = 64
+                last_start = pos
+                count += 1
+                pos = next_pos
+    finally:
+        EVP_MD_CTX_free(ctx_in)
+        EVP_MD_CTX_free(ctx_out)
+
+    if last_start >= 0:
+        prev_stamp = bytes(prev_ptr[:prev_len])
+    return count, pos, status, prev_stamp
@@ -8,12 +8,13 @@ Desktop version v2.1 (same numeric kernel as v2.0):
 - Live UI for UTC, final_align, band, stamp
 - (U, W) kernel with bounded alignment lane
 - Tamper-evident stamp chain
-- Export CSV with tick_ms, dt_ms, a_stress
+- CSV with tick_ms, dt_ms, a_stress, streamed to disk while running
 - In-app Verify Chain
 - Band-aware colours for stability
 - Stability bar for final_align in (-1,+1)
 - Alignment stress slider (a_stress)
 - Tick cadence selector (tick_ms presets)
+- Kernel loop in a background thread, UI fed through a queue
 - Auto-stop after AUTO_STOP_TICKS ticks
 - last dt_ms colour-coded for jitter
 - NEW: Real-entropy alignment source based on dt_ms jitter + micro-noise
@@ -26,15 +27,25 @@ Licensing.
   existing CC BY 4.0 research licenses.
 """
 
+import os
 import time
 import math
 import hashlib
 import csv
-import random
-from datetime import datetime, timezone
+import struct
+import queue
+import threading
+from array import array
+from binascii import hexlify
+from bisect import bisect_right
 import tkinter as tk
 from tkinter import messagebox
 
+try:
+    from clockke_kernel_nb import step as _step_decay, step_nodecay as _step_nodecay
+except ImportError:  # script copied on its own: step_local() below is used
+    _step_decay = _step_nodecay = None
+
 # ---------------------------
 # Manifest-style parameters
 # ---------------------------
@@ -69,6 +80,21 @@ STRESS_INIT = 0.0
 AUTO_STOP_TICKS = 600
 
 CSV_BASENAME = "stamps_clockke"
+CSV_BUFFER_BYTES = 1 << 16  # write buffer for the streamed session CSV
+CSV_HEADER = [
+    "tick_index",
+    "time_utc",
+    "final_align",
+    "band",
+    "stamp",
+    "tick_ms",
+    "dt_ms",
+    "a_stress",
+]
+
+# Kernel thread -> Tk hand-off: queue depth and UI poll interval (ms)
+UI_QUEUE_SIZE = 4
+UI_POLL_MS = 50
 
 # Band colour map
 BAND_COLORS = {
@@ -79,13 +105,51 @@ BAND_COLORS = {
     "D":  "#CC0000",  # red
 }
 
-# RNG for micro-noise (system-level entropy)
-rng = random.SystemRandom()
+# Band lower edges (ascending) and labels; a_out >= edge[i] => label[i + 1]
+BAND_EDGES = (-0.10, 0.10, 0.40, 0.80)
+BAND_LABELS = ("D", "C", "B", "A", "A+")
+
+# Band labels pre-encoded for the stamp payload
+_BAND_BYTES = {label: label.encode("ascii") for label in BAND_LABELS}
+
+# uint64 -> [-1, +1) scale for BatchEntropy
+_TWO_POW_M63 = 2.0 ** -63
 
 # ---------------------------
 # Helper functions
 # ---------------------------
 
+class BatchEntropy:
+    """
+    Micro-noise source backed by os.urandom, read in batches.
+
+    One os.urandom(8 * bufsize) call is unpacked into bufsize uint64 values
+    and mapped to uniform floats in [-1, +1), so the per-tick cost is a list
+    index instead of a SystemRandom.uniform() syscall.
+    """
+
+    def __init__(self, bufsize=1024):
+        self._bufsize = bufsize
+        self._fmt = f"<{bufsize}Q"
+        self._buf = []
+        self._i = 0
+
+    def _refill(self):
+        raw = os.urandom(8 * self._bufsize)
+        ints = struct.unpack(self._fmt, raw)
+        self._buf = [i * _TWO_POW_M63 - 1.0 for i in ints]
+        self._i = 0
+
+    def next_uniform_pm1(self):
+        if self._i >= len(self._buf):
+            self._refill()
+        v = self._buf[self._i]
+        self._i += 1
+        return v
+
+# Micro-noise source (system-level entropy)
+entropy = BatchEntropy()
+
 def clamp_a(a):
     """Clamp a into (-1 + EPS_A, +1 - EPS_A)."""
     lo = -1.0 + EPS_A
@@ -103,6 +167,24 @@ def atanh_safe(x):
     """
     return 0.5 * (math.log1p(x) - math.log1p(-x))
 
+def step_local(a_raw, U, W, decay_w, w_default, eps_w, eps_a):
+    """
+    Pure-Python kernel tick, used when clockke_kernel_nb.py cannot be
+    imported. Same signature and arithmetic as clockke_kernel_nb.step()
+    (the clamp margin is EPS_A, via clamp_a).
+    Returns (a_out, U, W).
+    """
+    u = atanh_safe(clamp_a(a_raw))
+    U = decay_w * U + w_default * u
+    W = decay_w * W + w_default
+    return math.tanh(U / max(W, eps_w)), U, W
+
+# Kernel step specialised once for the configured decay
+if _step_decay is None:
+    kernel_step = step_local
+else:
+    kernel_step = _step_nodecay if DECAY_W == 1.0 else _step_decay
+
 def classify_band(a_out):
     """
     Band classification for real-entropy ClockKe v2.1.
@@ -111,26 +193,28 @@ def classify_band(a_out):
     - Positive side => B, A, A+ as alignment rises
     - Negative beyond -0.10 => D (unusual / overspeed / concern)
     """
-    if a_out >= 0.80:
-        return "A+"
-    elif a_out >= 0.40:
-        return "A"
-    elif a_out >= 0.10:
-        return "B"
-    elif a_out >= -0.10:
-        return "C"
-    else:
-        return "D"
+    return BAND_LABELS[bisect_right(BAND_EDGES, a_out)]
 
-def now_utc_iso():
-    """Return current UTC time as ISO 8601 string."""
-    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+def iso_from_epoch(epoch):
+    """
+    Return the ISO 8601 UTC string for a Unix epoch value.
+    Uses time.gmtime + f-string fields (no datetime / strftime per tick).
+    """
+    tm = time.gmtime(epoch)
+    return (
+        f"{tm.tm_year:04d}-{tm.tm_mon:02d}-{tm.tm_mday:02d}"
+        f"T{tm.tm_hour:02d}:{tm.tm_min:02d}:{tm.tm_sec:02d}Z"
+    )
 
 def now_utc_stamp_for_filename():
     """Return compact UTC timestamp for filenames."""
-    return datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%SZ")
+    tm = time.gmtime()
+    return (
+        f"{tm.tm_year:04d}{tm.tm_mon:02d}{tm.tm_mday:02d}"
+        f"_{tm.tm_hour:02d}{tm.tm_min:02d}{tm.tm_sec:02d}Z"
+    )
 
-def source_a_raw(now_epoch, dt_ms, tick_ms, a_stress, rng_obj):
+def source_a_raw(now_epoch, dt_ms, tick_ms, a_stress, entropy_src):
     """
     Real-entropy alignment source for v2.1.
 
@@ -167,22 +251,22 @@ def source_a_raw(now_epoch, dt_ms, tick_ms, a_stress, rng_obj):
         base -= FREEZE_PENALTY
 
     # Small symmetric noise in [-NOISE_AMPL, +NOISE_AMPL]
-    noise_unit = rng_obj.uniform(-1.0, 1.0)
+    noise_unit = entropy_src.next_uniform_pm1()
     noise_term = NOISE_AMPL * noise_unit
 
     return base + jitter_term + noise_term
 
-def make_stamp(prev_stamp, payload_str, time_utc_str):
+def make_stamp(prev_stamp, payload_bytes, time_utc_bytes):
     """
     Chain rule:
-    stamp_k := sha256(prev_stamp || sha256(payload_bytes) || time_utc_str)
+    stamp_k := sha256(prev_stamp || sha256(payload_bytes) || time_utc_bytes)
+    Digests and stamps are lowercase hex text (prev_stamp and result as bytes).
     """
-    payload_bytes = payload_str.encode("utf-8")
-    h_payload = hashlib.sha256(payload_bytes).hexdigest().encode("utf-8")
-    prev_bytes = (prev_stamp or "").encode("utf-8")
-    time_bytes = time_utc_str.encode("utf-8")
-    raw = prev_bytes + h_payload + time_bytes
-    return hashlib.sha256(raw).hexdigest()
+    h_payload = hexlify(hashlib.sha256(payload_bytes).digest())
+    h_outer = hashlib.sha256(prev_stamp)
+    h_outer.update(h_payload)
+    h_outer.update(time_utc_bytes)
+    return hexlify(h_outer.digest())
 
 def dt_color(dt_ms, tick_ms):
     """
@@ -201,18 +285,175 @@ def dt_color(dt_ms, tick_ms):
     else:
         return "#CC0000"   # very jittery / delayed
 
+# ---------------------------
+# Kernel thread
+# ---------------------------
+
+class KernelThread(threading.Thread):
+    """
+    Runs the numeric kernel, stamp chain and CSV writes off the Tk thread.
+
+    Ticks follow an absolute time.monotonic_ns() deadline grid, so UI
+    redraws and Tcl event handling no longer add jitter to dt_ms. Tk is
+    never touched here: tick_ms and a_stress are plain attributes set by
+    the UI thread, and per-tick UI values are pushed to the bounded queue
+    self.q, which the Tk loop drains with after(UI_POLL_MS, ...).
+    """
+
+    def __init__(self, tick_ms, a_stress):
+        super().__init__(daemon=True)
+        self.tick_ms = tick_ms
+        self.a_stress = a_stress
+        self.q = queue.Queue(maxsize=UI_QUEUE_SIZE)
+        self.stop_event = threading.Event()
+        self.auto_stopped = False
+        self.error = None
+
+        # Recorded rows, one column per CSV field (numeric columns unboxed)
+        self.cols = {
+            "tick_index": array("i"),
+            "time_utc": [],
+            "final_align": [],
+            "band": [],
+            "stamp": [],
+            "tick_ms": array("d"),
+            "dt_ms": array("d"),
+            "a_stress": array("d"),
+        }
+        self._col_appends = tuple(col.append for col in self.cols.values())
+        # Guards the columns and the CSV file, which the UI thread may flush
+        self.rows_lock = threading.Lock()
+
+        # Session CSV is opened here so a failure surfaces in on_start()
+        ts = now_utc_stamp_for_filename()
+        self.csv_filename = f"{CSV_BASENAME}_{ts}.csv"
+        self._csv_file = open(self.csv_filename, "w", newline="", encoding="utf-8",
+                              buffering=CSV_BUFFER_BYTES)
+        self._csv_writer = csv.writer(self._csv_file)
+        self._csv_writer.writerow(CSV_HEADER)
+
+    def row_count(self):
+        with self.rows_lock:
+            return len(self.cols["tick_index"])
+
+    def snapshot_rows(self):
+        """Rows zipped back out of the columns, safe to iterate from the UI thread."""
+        with self.rows_lock:
+            return list(zip(*self.cols.values()))
+
+    def flush_csv(self):
+        """Flush the rows written so far to disk (no-op once the file is closed)."""
+        with self.rows_lock:
+            if not self._csv_file.closed:
+                self._csv_file.flush()
+
+    def _post(self, item):
+        """Queue a UI update; if the UI is behind, drop the oldest one."""
+        try:
+            self.q.put_nowait(item)
+        except queue.Full:
+            try:
+                self.q.get_nowait()
+            except queue.Empty:
+                pass
+            self.q.put_nowait(item)
+
+    def run(self):
+        try:
+            self._run_ticks()
+        except Exception as e:
+            self.error = e
+        finally:
+            with self.rows_lock:
+                self._csv_file.close()
+
+    def _run_ticks(self):
+        step_fn = kernel_step  # local binding for the tick loop
+        U = 0.0
+        W = 0.0
+        prev_stamp = b""
+        last_tick_mono = None  # time.monotonic_ns() of the previous tick
+        deadline_ns = time.monotonic_ns()
+
+        for tick_index in range(1, AUTO_STOP_TICKS + 1):
+            if self.stop_event.is_set():
+                return
+
+            tick_ms = self.tick_ms
+            a_stress = self.a_stress
+
+            # Monotonic clock for dt_ms (immune to wall-clock steps), wall clock for time_utc
+            now_mono = time.monotonic_ns()
+            now_epoch = time.time()
+            time_utc = iso_from_epoch(now_epoch)
+            time_utc_bytes = time_utc.encode("ascii")
+
+            # dt_ms calculation
+            if last_tick_mono is None:
+                # Treat first tick as if it matched the planned cadence
+                dt_ms = float(tick_ms)
+            else:
+                dt_ms = (now_mono - last_tick_mono) / 1e6
+            last_tick_mono = now_mono
+
+            # 1. Get alignment source including dt_ms, tick_ms, and stress
+            a_raw = source_a_raw(now_epoch, dt_ms, tick_ms, a_stress, entropy)
+
+            # 2. U/W kernel with exponential decay
+            a_out, U, W = step_fn(a_raw, U, W, DECAY_W, W_DEFAULT, EPS_W, EPS_A)
+
+            # 3. Band
+            band = classify_band(a_out)
+
+            # 4. Payload + stamp
+            final_align_str = "%+.9f" % a_out
+            payload_bytes = b"%s|%s|%s" % (
+                time_utc_bytes, final_align_str.encode("ascii"), _BAND_BYTES[band]
+            )
+            prev_stamp = make_stamp(prev_stamp, payload_bytes, time_utc_bytes)
+            stamp = prev_stamp.decode("ascii")
+
+            # 5. Record row (kept for Verify, streamed to the session CSV)
+            row = (
+                tick_index,
+                time_utc,
+                final_align_str,
+                band,
+                stamp,
+                tick_ms,
+                dt_ms,
+                a_stress,
+            )
+            with self.rows_lock:
+                for append, value in zip(self._col_appends, row):
+                    append(value)
+                self._csv_writer.writerow(row)
+
+            # 6. Hand the UI values to the Tk thread
+            self._post((tick_index, time_utc, final_align_str, band, stamp,
+                        tick_ms, dt_ms, a_out))
+
+            # Sleep until the next grid deadline (Stop wakes us at once)
+            deadline_ns += int(tick_ms * 1_000_000)
+            sleep_ns = deadline_ns - time.monotonic_ns()
+            if sleep_ns > 0:
+                if self.stop_event.wait(sleep_ns / 1e9):
+                    return
+            else:
+                deadline_ns = time.monotonic_ns()
+
+        self.auto_stopped = True
+
 # ---------------------------
 # State for clockke session
 # ---------------------------
 
-U = 0.0
-W = 0.0
-prev_stamp = ""
-tick_index = 1
 running = False
-rows = []   # (tick_index, time_utc, final_align, band, stamp, tick_ms, dt_ms, a_stress)
+kernel = None   # KernelThread of the current / last session
 
-last_tick_epoch = None
+# Latest per-tick UI values applied by flush_ui()
+ui_applied = {}         # widget -> kwargs last applied (unchanged ones are skipped)
+last_bar_drawn = None   # (length_px, color) the bar currently shows
 
 # ---------------------------
 # UI setup
@@ -251,6 +492,12 @@ center_x = canvas_width // 2
 canvas_stability.create_line(center_x, 2, center_x, canvas_height - 2,
                              fill="#808080")
 
+# Bar item is created once and then moved / recoloured by draw_stability_bar
+bar_id = canvas_stability.create_rectangle(
+    center_x, 3, center_x, canvas_height - 3,
+    fill="", outline="", tags="bar", state="hidden"
+)
+
 lbl_stability_caption = tk.Label(
     root,
     text="stability bar (center = 0, right = +1, left = -1)",
@@ -319,16 +566,12 @@ lbl_manifest.grid(row=12, column=0, columnspan=4, padx=8, pady=4, sticky="w")
 # ---------------------------
 
 def reset_engine():
-    global U, W, prev_stamp, tick_index, rows, last_tick_epoch
-    U = 0.0
-    W = 0.0
-    prev_stamp = ""
-    tick_index = 1
-    rows = []
-    last_tick_epoch = None
+    global last_bar_drawn, ui_applied
     lbl_dt.config(text="last dt_ms: -", fg="#000000")
     lbl_tick_count.config(text="ticks: 0")
-    canvas_stability.delete("bar")
+    canvas_stability.itemconfig(bar_id, state="hidden")
+    last_bar_drawn = None
+    ui_applied = {}
     lbl_status.config(text="ready.")
 
 def update_stress_label():
@@ -339,16 +582,23 @@ def draw_stability_bar(a_out, band):
     """
     Draw a bar representing a_out in (-1,+1).
     Center is 0. Extends left for negative, right for positive.
+    The single bar item is moved with coords(); nothing is re-created.
+    Nothing is sent to Tk unless the pixel length or the colour changes.
     """
-    canvas_stability.delete("bar")
-
+    global last_bar_drawn
     a_vis = max(-1.0, min(1.0, a_out))
     half_width = canvas_width // 2
     center = half_width
     max_len = half_width - 4
 
     length = int(a_vis * max_len)
+    color = BAND_COLORS.get(band, "#000000")
+    if last_bar_drawn == (length, color):
+        return
+    last_bar_drawn = (length, color)
+
     if length == 0:
+        canvas_stability.itemconfig(bar_id, state="hidden")
         return
 
     if length > 0:
@@ -361,168 +611,186 @@ def draw_stability_bar(a_out, band):
     y0 = 3
     y1 = canvas_height - 3
 
-    color = BAND_COLORS.get(band, "#000000")
-    canvas_stability.create_rectangle(
-        x0, y0, x1, y1,
-        fill=color, outline=color,
-        tags="bar"
-    )
+    canvas_stability.coords(bar_id, x0, y0, x1, y1)
+    canvas_stability.itemconfig(bar_id, fill=color, outline=color, state="normal")
 
-def tick():
-    global U, W, prev_stamp, tick_index, running, rows, last_tick_epoch, TICK_MS
+def flush_ui(item):
+    """Apply one tick's UI values; unchanged labels and bar are skipped."""
+    tick_index, time_utc, final_align_str, band, stamp, tick_ms, dt_ms, a_out = item
 
+    stamp_tail = f"{stamp[:8]}…{stamp[-8:]}"
+    state = {
+        lbl_utc: {"text": f"UTC: {time_utc}"},
+        lbl_align: {"text": f"final_align: {final_align_str}"},
+        lbl_band: {"text": f"band: {band}", "fg": BAND_COLORS.get(band, "#000000")},
+        lbl_stamp: {"text": f"stamp: {stamp_tail}"},
+        lbl_status: {"text": f"running… ticks={tick_index}"},
+        lbl_tick_count: {"text": f"ticks: {tick_index}"},
+        # dt_ms with colour
+        lbl_dt: {"text": f"last dt_ms: {dt_ms:0.1f}", "fg": dt_color(dt_ms, tick_ms)},
+    }
     if not running:
-        return
+        del state[lbl_status]
 
-    # Auto-stop guard
-    if tick_index > AUTO_STOP_TICKS:
-        running = False
-        lbl_status.config(text=f"auto-stop after {AUTO_STOP_TICKS} ticks.")
-        messagebox.showinfo("clockke", f"Auto-stop after {AUTO_STOP_TICKS} ticks.")
+    for widget, opts in state.items():
+        if ui_applied.get(widget) != opts:
+            widget.config(**opts)
+            ui_applied[widget] = opts
+
+    draw_stability_bar(a_out, band)
+
+def drain_ui_queue():
+    """
+    Tk-side poll: apply only the newest queued tick, then either keep
+    polling or finish the session once the kernel thread has ended.
+    """
+    global running
+    if kernel is None:
         return
 
-    # Refresh TICK_MS from selector
-    TICK_MS = tick_ms_var.get()
+    latest = None
+    while True:
+        try:
+            latest = kernel.q.get_nowait()
+        except queue.Empty:
+            break
+    if latest is not None:
+        flush_ui(latest)
 
-    now_epoch = time.time()
-    time_utc = now_utc_iso()
+    if not running:
+        return
 
-    # dt_ms calculation
-    if last_tick_epoch is None:
-        # Treat first tick as if it matched the planned cadence
-        dt_ms = float(TICK_MS)
-    else:
-        dt_ms = (now_epoch - last_tick_epoch) * 1000.0
-    last_tick_epoch = now_epoch
+    if kernel.is_alive():
+        root.after(UI_POLL_MS, drain_ui_queue)
+        return
 
-    # 1. Get alignment source including dt_ms, tick_ms, and stress
-    a_stress = stress_var.get()
-    a_raw = source_a_raw(now_epoch, dt_ms, TICK_MS, a_stress, rng)
-
-     # 2. U/W kernel with exponential decay
-    a_c = clamp_a(a_raw)
-    u = atanh_safe(a_c)
-
-    U = DECAY_W * U + W_DEFAULT * u
-    W = DECAY_W * W + W_DEFAULT
-
-    denom = W if W > EPS_W else EPS_W
-    a_out = math.tanh(U / denom)
-
-    # 3. Band
-    band = classify_band(a_out)
-
-    # 4. Payload + stamp
-    final_align_str = f"{a_out:+.9f}"
-    payload_str = f"{time_utc}|{final_align_str}|{band}"
-    stamp = make_stamp(prev_stamp, payload_str, time_utc)
-    prev_stamp = stamp
-
-    # 5. Record row
-    rows.append(
-        (
-            tick_index,
-            time_utc,
-            final_align_str,
-            band,
-            stamp,
-            TICK_MS,
-            dt_ms,
-            a_stress,
-        )
-    )
+    # Thread ended on its own: auto-stop or error
+    running = False
+    if kernel.error is not None:
+        lbl_status.config(text="kernel error.")
+        messagebox.showerror("clockke", f"Kernel stopped: {kernel.error}")
+    elif kernel.auto_stopped:
+        lbl_status.config(text=f"auto-stop after {AUTO_STOP_TICKS} ticks.")
+        messagebox.showinfo("clockke", f"Auto-stop after {AUTO_STOP_TICKS} ticks.")
 
-    # 6. UI updates
-    stamp_tail = f"{stamp[:8]}…{stamp[-8:]}"
-    lbl_utc.config(text=f"UTC: {time_utc}")
-    lbl_align.config(text=f"final_align: {final_align_str}")
-    lbl_band.config(
-        text=f"band: {band}",
-        fg=BAND_COLORS.get(band, "#000000")
-    )
-    lbl_stamp.config(text=f"stamp: {stamp_tail}")
-    lbl_status.config(text=f"running… ticks={tick_index}")
-    lbl_tick_count.config(text=f"ticks: {tick_index}")
-
-    # dt_ms with colour
-    lbl_dt.config(
-        text=f"last dt_ms: {dt_ms:0.1f}",
-        fg=dt_color(dt_ms, TICK_MS)
-    )
+def on_tick_ms_change(*_):
+    if kernel is not None:
+        kernel.tick_ms = tick_ms_var.get()
 
-    draw_stability_bar(a_out, band)
+def on_stress_change(*_):
     update_stress_label()
+    if kernel is not None:
+        kernel.a_stress = stress_var.get()
 
-    tick_index += 1
-    root.after(TICK_MS, tick)
+def stop_kernel():
+    """Signal the kernel thread to stop and wait for it to close the CSV."""
+    if kernel is not None and kernel.is_alive():
+        kernel.stop_event.set()
+        kernel.join()
 
 def on_start():
-    global running
+    global running, kernel
     if running:
         return
     reset_engine()
+    try:
+        kernel = KernelThread(tick_ms_var.get(), stress_var.get())
+    except Exception as e:
+        lbl_status.config(text="cannot open CSV.")
+        messagebox.showerror("clockke", f"Cannot open session CSV: {e}")
+        return
     running = True
     lbl_status.config(text="running…")
-    tick()
+    kernel.start()
+    root.after(UI_POLL_MS, drain_ui_queue)
 
 def on_stop():
     global running
     running = False
+    stop_kernel()
+    drain_ui_queue()
     lbl_status.config(text="stopped.")
 
+def on_close():
+    stop_kernel()
+    root.destroy()
+
 def on_export():
-    if not rows:
+    """
+    Rows are already streamed to the session CSV; flush it and report.
+    """
+    if kernel is None or not kernel.row_count():
         messagebox.showinfo("clockke", "No ticks recorded yet.")
         return
 
-    ts = now_utc_stamp_for_filename()
-    filename = f"{CSV_BASENAME}_{ts}.csv"
-
     try:
-        with open(filename, "w", newline="", encoding="utf-8") as f_csv:
-            writer = csv.writer(f_csv)
-            writer.writerow(
-                [
-                    "tick_index",
-                    "time_utc",
-                    "final_align",
-                    "band",
-                    "stamp",
-                    "tick_ms",
-                    "dt_ms",
-                    "a_stress",
-                ]
-            )
-            for r in rows:
-                writer.writerow(r)
-        lbl_status.config(text=f"exported {filename}")
-        messagebox.showinfo("clockke", f"Exported {filename}")
+        # Every recorded row is on disk once this returns
+        kernel.flush_csv()
+        lbl_status.config(text=f"exported {kernel.csv_filename}")
+        messagebox.showinfo("clockke", f"Exported {kernel.csv_filename}")
     except Exception as e:
         lbl_status.config(text="export failed.")
         messagebox.showerror("clockke", f"Export failed: {e}")
 
-def verify_rows():
+def verify_chain(rows):
     """
-    Verify in-memory rows using:
+    Single-pass chain check over any iterable of rows
+    (tick_index, time_utc, final_align, band, stamp, ...):
     payload_str := 'time_utc|final_align|band'
     stamp_k := sha256(prev_stamp || sha256(payload_bytes) || time_utc)
+
+    Returns (ok, ticks_verified_or_bad_tick, stored, expected).
     """
-    if not rows:
-        return True, 0, "", ""
+    prev = b""
+    n = 0
+    # Hoisted lookups: the loop body runs once per tick
+    band_bytes_for = _BAND_BYTES.get
+    stamp_fn = make_stamp
+    for row in rows:
+        if len(row) < 5:
+            if not row:
+                continue  # blank line
+            # Too few fields to check: report it as the mismatch
+            return False, row[0], "", ""
+        tick_idx, time_utc, final_align_str, band, stamp = row[0], row[1], row[2], row[3], row[4]
+        time_utc_bytes = time_utc.encode("utf-8")
+        band_bytes = band_bytes_for(band) or band.encode("utf-8")
+        payload_bytes = b"%s|%s|%s" % (
+            time_utc_bytes, final_align_str.encode("utf-8"), band_bytes
+        )
+        expected = stamp_fn(prev, payload_bytes, time_utc_bytes)
+        stored = stamp.encode("utf-8")
+        if expected != stored:
+            return False, tick_idx, stamp, expected.decode("ascii")
+        prev = stored
+        n += 1
 
-    prev = ""
-    for r in rows:
-        tick_idx, time_utc, final_align_str, band, stamp = r[:5]
-        payload_str = f"{time_utc}|{final_align_str}|{band}"
-        expected = make_stamp(prev, payload_str, time_utc)
-        if expected != stamp:
-            return False, tick_idx, stamp, expected
-        prev = stamp
+    return True, n, "", ""
 
-    return True, len(rows), "", ""
+def verify_rows():
+    """Verify the in-memory rows of the current session."""
+    rows = kernel.snapshot_rows() if kernel is not None else []
+    return verify_chain(rows)
+
+def verify_file(path):
+    """Verify a session CSV by streaming it from disk, one row at a time."""
+    with open(path, "r", newline="", encoding="utf-8", buffering=CSV_BUFFER_BYTES) as f_csv:
+        reader = csv.reader(f_csv)
+        if next(reader, None) is None:
+            return True, 0, "", ""
+        return verify_chain(reader)
 
 def on_verify():
-    ok, val, stored, expected = verify_rows()
+    try:
+        if kernel is not None and not kernel.is_alive():
+            # Session finished: its CSV is closed and complete on disk
+            ok, val, stored, expected = verify_file(kernel.csv_filename)
+        else:
+            ok, val, stored, expected = verify_rows()
+    except Exception as e:
+        lbl_status.config(text="verification FAILED.")
+        messagebox.showerror("clockke", f"Verify failed: {e}")
+        return
     if ok:
         msg = f"ALL CHECKS PASSED\nTicks verified: {val}"
         lbl_status.config(text="ALL CHECKS PASSED.")
@@ -546,6 +814,10 @@ btn_stop.config(command=on_stop)
 btn_export.config(command=on_export)
 btn_verify.config(command=on_verify)
 
+tick_ms_var.trace_add("write", on_tick_ms_change)
+stress_var.trace_add("write", on_stress_change)
+root.protocol("WM_DELETE_WINDOW", on_close)
+
 update_stress_label()
 lbl_status.config(text="ready. press Start to begin symbolic time.")
 
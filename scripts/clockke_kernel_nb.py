@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+clockke_kernel_nb.py
+Shunyaya Symbolic Mathematical Clock Kernel (SSM-ClockKe)
+
+Fused per-tick (U, W) kernel shared by the desktop and CLI scripts:
+clamp_a -> atanh_safe -> decay update -> tanh in a single call.
+
+When Numba is installed, step() is compiled with @njit(cache=True) so a
+tick costs one native call instead of several Python-level helpers.
+Without Numba the same function runs as plain Python; the arithmetic is
+identical, so both paths give the same final_align for the same inputs.
+
+step_nodecay() is the same kernel specialised for decay_w == 1.0; callers
+pick one of the two once, at import time, from their DECAY_W constant.
+
+Both are compiled eagerly at import (explicit signature), so the JIT
+never runs inside a tick and never shows up in the next tick's dt_ms.
+"""
+
+import math
+
+try:
+    from numba import njit
+except ImportError:  # optional dependency
+    njit = None
+
+def step(a_raw, U, W, decay_w, w_default, eps_w, eps_a):
+    """
+    One kernel tick:
+    a_c   = clamp(a_raw, -1 + eps_a, +1 - eps_a)
+    u     = atanh(a_c)            (via log1p)
+    U     = decay_w * U + w_default * u
+    W     = decay_w * W + w_default
+    a_out = tanh(U / max(W, eps_w))
+
+    Returns (a_out, U, W).
+    """
+    a = max(-1.0 + eps_a, min(1.0 - eps_a, a_raw))
+    u = 0.5 * (math.log1p(a) - math.log1p(-a))
+    U = decay_w * U + w_default * u
+    W = decay_w * W + w_default
+    denom = W if W > eps_w else eps_w
+    return math.tanh(U / denom), U, W
+
+def step_nodecay(a_raw, U, W, decay_w, w_default, eps_w, eps_a):
+    """
+    step() for decay_w == 1.0 (decay_w is accepted for a uniform signature
+    and ignored): U = U + w_default * u, W = W + w_default.
+
+    Returns (a_out, U, W).
+    """
+    a = max(-1.0 + eps_a, min(1.0 - eps_a, a_raw))
+    u = 0.5 * (math.log1p(a) - math.log1p(-a))
+    U = U + w_default * u
+    W = W + w_default
+    denom = W if W > eps_w else eps_w
+    return math.tanh(U / denom), U, W
+
+# (a_raw, U, W, decay_w, w_default, eps_w, eps_a) -> (a_out, U, W)
+_STEP_SIGNATURE = "UniTuple(float64, 3)(float64, float64, float64, float64, float64, float64, float64)"
+
+if njit is not None:
+    step = njit(_STEP_SIGNATURE, cache=True)(step)
+    step_nodecay = njit(_STEP_SIGNATURE, cache=True)(step_nodecay)
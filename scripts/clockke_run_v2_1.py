@@ -8,11 +8,12 @@ CLI version v2.1 (aligned with the SSM-ClockKe v2.1 specification):
 - Same numeric kernel as v2.0 (no change to U, W, final_align, or band logic)
 - Headless loop with UTC, final_align, band, stamp per tick
 - (U, W) kernel with bounded alignment lane
-- Tamper-evident stamp chain (SHA-256 based)
-- Export CSV with tick_ms, dt_ms, a_stress (here a_stress := 0.0)
+- Tamper-evident stamp chain (SHA-256 based; BLAKE2b / BLAKE3 via --hash)
+- CSV with tick_ms, dt_ms, a_stress (here a_stress := 0.0), streamed per tick
 - Real-entropy alignment source based on dt_ms jitter + micro-noise
 - Simple band classification and console log per tick
 - Optional max tick count via --ticks (otherwise run until Ctrl+C)
+- Offline batch mode via --batch (NumPy-vectorised kernel, no sleeping)
 
 Licensing.
 - SSM-ClockKe is released as an open-standard kernel: free to implement or adapt
@@ -22,13 +23,30 @@ Licensing.
   existing CC BY 4.0 research licenses.
 """
 
+import os
 import time
 import math
 import hashlib
 import csv
-import random
+import struct
 import argparse
-from datetime import datetime, timezone
+from binascii import hexlify
+from bisect import bisect_right
+
+try:
+    from clockke_kernel_nb import step as _step_decay, step_nodecay as _step_nodecay
+except ImportError:  # script copied on its own: step_local() below is used
+    _step_decay = _step_nodecay = None
+
+try:
+    from blake3 import blake3  # optional, only for --hash blake3
+except ImportError:
+    blake3 = None
+
+try:
+    import numpy as np  # optional, only for --batch
+except ImportError:
+    np = None
 
 # ---------------------------
 # Manifest-style parameters
@@ -57,17 +75,71 @@ NOISE_AMPL = 0.01          # amplitude of random micro-noise in [-NOISE_AMPL,+NO
 AUTO_STOP_TICKS_DEFAULT = 0  # 0 => run until Ctrl+C
 
 CSV_BASENAME = "stamps_clockke_cli"
+CSV_BUFFER_BYTES = 1 << 20         # write buffer for batch CSV export
+CSV_STREAM_BUFFER_BYTES = 1 << 16  # write buffer for the live, streamed CSV
+CSV_HEADER = [
+    "tick_index",
+    "time_utc",
+    "final_align",
+    "band",
+    "stamp",
+    "tick_ms",
+    "dt_ms",
+    "a_stress",
+]
+
+# Stamp chain hash (sha256 is the v2.1 reference; others tag the manifest id)
+HASH_DEFAULT = "sha256"
+HASH_CHOICES = ("sha256", "blake2b", "blake3")
 
 # How many recent points to show in the history sparkline
 HISTORY_LEN = 24
 
-# RNG for micro-noise (system-level entropy)
-rng = random.SystemRandom()
+# Band lower edges (ascending) and labels; a_out >= edge[i] => label[i + 1]
+BAND_EDGES = (-0.10, 0.10, 0.40, 0.80)
+BAND_LABELS = ("D", "C", "B", "A", "A+")
+
+# Band labels pre-encoded for the stamp payload
+_BAND_BYTES = {label: label.encode("ascii") for label in BAND_LABELS}
+
+# uint64 -> [-1, +1) scale for BatchEntropy
+_TWO_POW_M63 = 2.0 ** -63
 
 # ---------------------------
 # Helper functions
 # ---------------------------
 
+class BatchEntropy:
+    """
+    Micro-noise source backed by os.urandom, read in batches.
+
+    One os.urandom(8 * bufsize) call is unpacked into bufsize uint64 values
+    and mapped to uniform floats in [-1, +1), so the per-tick cost is a list
+    index instead of a SystemRandom.uniform() syscall.
+    """
+
+    def __init__(self, bufsize=1024):
+        self._bufsize = bufsize
+        self._fmt = f"<{bufsize}Q"
+        self._buf = []
+        self._i = 0
+
+    def _refill(self):
+        raw = os.urandom(8 * self._bufsize)
+        ints = struct.unpack(self._fmt, raw)
+        self._buf = [i * _TWO_POW_M63 - 1.0 for i in ints]
+        self._i = 0
+
+    def next_uniform_pm1(self):
+        if self._i >= len(self._buf):
+            self._refill()
+        v = self._buf[self._i]
+        self._i += 1
+        return v
+
+# Micro-noise source (system-level entropy)
+entropy = BatchEntropy()
+
 def clamp_a(a):
     """Clamp a into (-1 + EPS_A, +1 - EPS_A)."""
     lo = -1.0 + EPS_A
@@ -85,6 +157,24 @@ def atanh_safe(x):
     """
     return 0.5 * (math.log1p(x) - math.log1p(-x))
 
+def step_local(a_raw, U, W, decay_w, w_default, eps_w, eps_a):
+    """
+    Pure-Python kernel tick, used when clockke_kernel_nb.py cannot be
+    imported. Same signature and arithmetic as clockke_kernel_nb.step()
+    (the clamp margin is EPS_A, via clamp_a).
+    Returns (a_out, U, W).
+    """
+    u = atanh_safe(clamp_a(a_raw))
+    U = decay_w * U + w_default * u
+    W = decay_w * W + w_default
+    return math.tanh(U / max(W, eps_w)), U, W
+
+# Kernel step specialised once for the configured decay
+if _step_decay is None:
+    kernel_step = step_local
+else:
+    kernel_step = _step_nodecay if DECAY_W == 1.0 else _step_decay
+
 def classify_band(a_out):
     """
     Band classification for real-entropy ClockKe v2.1.
@@ -93,26 +183,33 @@ def classify_band(a_out):
     - Positive side => B, A, A+ as alignment rises
     - Negative beyond -0.10 => D (unusual / overspeed / concern)
     """
-    if a_out >= 0.80:
-        return "A+"
-    elif a_out >= 0.40:
-        return "A"
-    elif a_out >= 0.10:
-        return "B"
-    elif a_out >= -0.10:
-        return "C"
-    else:
-        return "D"
+    return BAND_LABELS[bisect_right(BAND_EDGES, a_out)]
 
-def now_utc_iso():
-    """Return current UTC time as ISO 8601 string."""
-    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+def classify_band_vec(a_out):
+    """Vectorised classify_band for a NumPy array (used by --batch)."""
+    idx = np.searchsorted(BAND_EDGES, a_out, side="right")
+    return np.take(BAND_LABELS, idx)
+
+def iso_from_epoch(epoch):
+    """
+    Return the ISO 8601 UTC string for a Unix epoch value.
+    Uses time.gmtime + f-string fields (no datetime / strftime per tick).
+    """
+    tm = time.gmtime(epoch)
+    return (
+        f"{tm.tm_year:04d}-{tm.tm_mon:02d}-{tm.tm_mday:02d}"
+        f"T{tm.tm_hour:02d}:{tm.tm_min:02d}:{tm.tm_sec:02d}Z"
+    )
 
 def now_utc_stamp_for_filename():
     """Return compact UTC timestamp for filenames."""
-    return datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%SZ")
+    tm = time.gmtime()
+    return (
+        f"{tm.tm_year:04d}{tm.tm_mon:02d}{tm.tm_mday:02d}"
+        f"_{tm.tm_hour:02d}{tm.tm_min:02d}{tm.tm_sec:02d}Z"
+    )
 
-def source_a_raw(now_epoch, dt_ms, tick_ms, rng_obj):
+def source_a_raw(now_epoch, dt_ms, tick_ms, entropy_src):
     """
     Real-entropy alignment source for CLI v2.1.
 
@@ -148,22 +245,48 @@ def source_a_raw(now_epoch, dt_ms, tick_ms, rng_obj):
         base -= FREEZE_PENALTY
 
     # Small symmetric noise in [-NOISE_AMPL, +NOISE_AMPL]
-    noise_unit = rng_obj.uniform(-1.0, 1.0)
+    noise_unit = entropy_src.next_uniform_pm1()
     noise_term = NOISE_AMPL * noise_unit
 
     return base + jitter_term + noise_term
 
-def make_stamp(prev_stamp, payload_str, time_utc_str):
+def blake2b_256(data=b""):
+    """BLAKE2b with a 32-byte digest, so stamps keep the SHA-256 width."""
+    return hashlib.blake2b(data, digest_size=32)
+
+def resolve_hash(name):
+    """
+    Return the hash constructor for a --hash choice.
+    Raises ValueError for unknown names or a missing optional backend.
+    """
+    if name == "sha256":
+        return hashlib.sha256
+    if name == "blake2b":
+        return blake2b_256
+    if name == "blake3":
+        if blake3 is None:
+            raise ValueError("--hash blake3 needs the 'blake3' package (pip install blake3)")
+        return blake3
+    raise ValueError(f"unknown hash: {name}")
+
+def manifest_id_for(hash_name):
+    """Manifest id, tagged with the hash name when it is not the default."""
+    if hash_name == HASH_DEFAULT:
+        return MANIFEST_ID
+    return f"{MANIFEST_ID}.{hash_name.upper()}"
+
+def make_stamp(prev_stamp, payload_bytes, time_utc_bytes, hash_fn=hashlib.sha256):
     """
     Chain rule:
-    stamp_k := sha256(prev_stamp || sha256(payload_bytes) || time_utc_str)
+    stamp_k := H(prev_stamp || H(payload_bytes) || time_utc_bytes)
+    with H = sha256 unless another hash_fn is selected.
+    Digests and stamps are lowercase hex text (prev_stamp and result as bytes).
     """
-    payload_bytes = payload_str.encode("utf-8")
-    h_payload = hashlib.sha256(payload_bytes).hexdigest().encode("utf-8")
-    prev_bytes = (prev_stamp or "").encode("utf-8")
-    time_bytes = time_utc_str.encode("utf-8")
-    raw = prev_bytes + h_payload + time_bytes
-    return hashlib.sha256(raw).hexdigest()
+    h_payload = hexlify(hash_fn(payload_bytes).digest())
+    h_outer = hash_fn(prev_stamp)
+    h_outer.update(h_payload)
+    h_outer.update(time_utc_bytes)
+    return hexlify(h_outer.digest())
 
 
 def spark_char(a):
@@ -187,28 +310,61 @@ def spark_char(a):
     else:
         return "^"
 
+# ---------------------------
+# CSV export
+# ---------------------------
+
+def new_csv_filename():
+    """Return a timestamped CSV filename in the working directory."""
+    return f"{CSV_BASENAME}_{now_utc_stamp_for_filename()}.csv"
+
+def open_csv_writer(filename, buffering=CSV_BUFFER_BYTES):
+    """Open filename for writing, emit the header row, return (file, writer)."""
+    f_csv = open(filename, "w", newline="", encoding="utf-8", buffering=buffering)
+    writer = csv.writer(f_csv)
+    writer.writerow(CSV_HEADER)
+    return f_csv, writer
+
+def export_rows(rows):
+    """Write rows (batch mode) to a new timestamped CSV file."""
+    if not rows:
+        print("\nNo rows recorded; nothing to export.")
+        return
+
+    filename = new_csv_filename()
+    try:
+        f_csv, writer = open_csv_writer(filename)
+        with f_csv:
+            writer.writerows(rows)
+        print(f"\nExported {len(rows)} rows to {filename}")
+    except Exception as e:
+        print(f"\nExport failed: {e}")
+
 # ---------------------------
 # Core run loop (CLI)
 # ---------------------------
 
-def run_clockke_cli(tick_sec, max_ticks):
+def run_clockke_cli(tick_sec, max_ticks, hash_name=HASH_DEFAULT):
     """
     Run clockke CLI loop with cadence tick_sec.
     If max_ticks > 0, stop after that many ticks,
     otherwise run until Ctrl+C.
+    hash_name selects the stamp chain hash (see HASH_CHOICES).
     """
     tick_ms = float(tick_sec) * 1000.0
+    hash_fn = resolve_hash(hash_name)
 
     U = 0.0
     W = 0.0
-    prev_stamp = ""
+    prev_stamp = b""
     tick_index = 1
-    rows = []
-    last_tick_epoch = None
+    n_rows = 0
+    last_tick_mono = None  # time.monotonic_ns() of the previous tick
     history = []  # recent final_align values for ASCII sparkline
 
     print("clockke CLI v2.1 — real-entropy kernel")
-    print(f"manifest_id      = {MANIFEST_ID}")
+    print(f"manifest_id      = {manifest_id_for(hash_name)}")
+    print(f"hash             = {hash_name}")
     print(f"tick_sec         = {tick_sec:.3f} (tick_ms = {tick_ms:.1f})")
     print(f"W_DEFAULT        = {W_DEFAULT:.3f}")
     print(f"DECAY_W          = {DECAY_W:.6f}")
@@ -221,46 +377,58 @@ def run_clockke_cli(tick_sec, max_ticks):
         print(f"max_ticks        = {max_ticks}")
     else:
         print("max_ticks        = (infinite, use Ctrl+C to stop)")
+
+    # Rows are streamed to disk as they are produced (no in-memory list)
+    filename = new_csv_filename()
+    try:
+        f_csv, writer = open_csv_writer(filename, CSV_STREAM_BUFFER_BYTES)
+    except Exception as e:
+        print(f"\nCannot open {filename}: {e}")
+        return
+    print(f"csv              = {filename}")
     print("Press Ctrl+C to interrupt.\n")
 
+    step_fn = kernel_step  # local binding for the tick loop
+
+    # Absolute tick grid on the monotonic clock (no cumulative drift)
+    tick_ns = int(round(tick_sec * 1e9))
+    deadline_ns = time.monotonic_ns()
+
     try:
         while True:
-            loop_start = time.time()
-            now_epoch = loop_start
-            time_utc = now_utc_iso()
+            # Monotonic clock for dt_ms / cadence, one wall-clock read for time_utc
+            now_mono = time.monotonic_ns()
+            now_epoch = time.time()
+            time_utc = iso_from_epoch(now_epoch)
+            time_utc_bytes = time_utc.encode("ascii")
 
             # dt_ms calculation
-            if last_tick_epoch is None:
+            if last_tick_mono is None:
                 # Treat first tick as if it matched the planned cadence
                 dt_ms = tick_ms
             else:
-                dt_ms = (now_epoch - last_tick_epoch) * 1000.0
-            last_tick_epoch = now_epoch
+                dt_ms = (now_mono - last_tick_mono) / 1e6
+            last_tick_mono = now_mono
 
             # 1. Get alignment source from real entropy
-            a_raw = source_a_raw(now_epoch, dt_ms, tick_ms, rng)
+            a_raw = source_a_raw(now_epoch, dt_ms, tick_ms, entropy)
 
             # 2. U/W kernel with exponential decay
-            a_c = clamp_a(a_raw)
-            u = atanh_safe(a_c)
-
-            U = DECAY_W * U + W_DEFAULT * u
-            W = DECAY_W * W + W_DEFAULT
-
-            denom = W if W > EPS_W else EPS_W
-            a_out = math.tanh(U / denom)
+            a_out, U, W = step_fn(a_raw, U, W, DECAY_W, W_DEFAULT, EPS_W, EPS_A)
 
             # 3. Band
             band = classify_band(a_out)
 
             # 4. Payload + stamp
-            final_align_str = f"{a_out:+.9f}"
-            payload_str = f"{time_utc}|{final_align_str}|{band}"
-            stamp = make_stamp(prev_stamp, payload_str, time_utc)
-            prev_stamp = stamp
+            final_align_str = "%+.9f" % a_out
+            payload_bytes = b"%s|%s|%s" % (
+                time_utc_bytes, final_align_str.encode("ascii"), _BAND_BYTES[band]
+            )
+            prev_stamp = make_stamp(prev_stamp, payload_bytes, time_utc_bytes, hash_fn)
+            stamp = prev_stamp.decode("ascii")
 
-            # 5. Record row (a_stress := 0.0 for CLI)
-            rows.append(
+            # 5. Write row (a_stress := 0.0 for CLI)
+            writer.writerow(
                 (
                     tick_index,
                     time_utc,
@@ -272,6 +440,7 @@ def run_clockke_cli(tick_sec, max_ticks):
                     0.0,  # a_stress
                 )
             )
+            n_rows += 1
 
             # Maintain recent history for ASCII sparkline
             history.append(a_out)
@@ -292,42 +461,92 @@ def run_clockke_cli(tick_sec, max_ticks):
 
             tick_index += 1
 
-            # Sleep to honour tick_sec cadence
-            elapsed = time.time() - loop_start
-            remaining = tick_sec - elapsed
-            if remaining > 0:
-                time.sleep(remaining)
+            # Sleep until the next grid deadline; resync after an overrun
+            deadline_ns += tick_ns
+            sleep_ns = deadline_ns - time.monotonic_ns()
+            if sleep_ns > 0:
+                time.sleep(sleep_ns / 1e9)
+            else:
+                deadline_ns = time.monotonic_ns()
 
     except KeyboardInterrupt:
         print("\nInterrupted by user (Ctrl+C).")
 
-    # Export CSV
-    if rows:
-        ts = now_utc_stamp_for_filename()
-        filename = f"{CSV_BASENAME}_{ts}.csv"
-        try:
-            with open(filename, "w", newline="", encoding="utf-8") as f_csv:
-                writer = csv.writer(f_csv)
-                writer.writerow(
-                    [
-                        "tick_index",
-                        "time_utc",
-                        "final_align",
-                        "band",
-                        "stamp",
-                        "tick_ms",
-                        "dt_ms",
-                        "a_stress",
-                    ]
-                )
-                for r in rows:
-                    writer.writerow(r)
-            print(f"\nExported {len(rows)} rows to {filename}")
-        except Exception as e:
-            print(f"\nExport failed: {e}")
+    finally:
+        f_csv.close()
+
+    if n_rows:
+        print(f"\nExported {n_rows} rows to {filename}")
     else:
+        os.remove(filename)
         print("\nNo rows recorded; nothing to export.")
 
+# ---------------------------
+# Offline batch mode (NumPy)
+# ---------------------------
+
+def run_clockke_cli_batch(n_ticks, tick_sec, hash_name=HASH_DEFAULT):
+    """
+    Simulate n_ticks ticks at cadence tick_sec without sleeping.
+
+    Ticks are placed on an ideal grid starting now, so dt_ms == tick_ms
+    (no jitter, no freeze penalty) and a_raw is BASELINE_A plus micro-noise.
+    Noise, clamp, atanh, W and tanh are computed as NumPy vectors; only the
+    U recursion and the stamp chain remain sequential.
+    """
+    tick_ms = float(tick_sec) * 1000.0
+    hash_fn = resolve_hash(hash_name)
+
+    print("clockke CLI v2.1 — offline batch kernel (NumPy)")
+    print(f"manifest_id      = {manifest_id_for(hash_name)}")
+    print(f"hash             = {hash_name}")
+    print(f"tick_sec         = {tick_sec:.3f} (tick_ms = {tick_ms:.1f})")
+    print(f"ticks            = {n_ticks}")
+
+    # 1. Alignment source: baseline + micro-noise on an ideal tick grid
+    noise = np.random.default_rng().uniform(-1.0, 1.0, n_ticks)
+    a_raw = BASELINE_A + NOISE_AMPL * noise
+
+    # 2. U/W kernel: vectorised clamp + atanh, sequential U, closed-form W
+    a_c = np.clip(a_raw, -1.0 + EPS_A, 1.0 - EPS_A)
+    u = 0.5 * (np.log1p(a_c) - np.log1p(-a_c))
+
+    U_vals = []
+    U = 0.0
+    for u_k in u.tolist():
+        U = DECAY_W * U + W_DEFAULT * u_k
+        U_vals.append(U)
+
+    k = np.arange(1, n_ticks + 1, dtype=np.float64)
+    if DECAY_W == 1.0:
+        W_vals = W_DEFAULT * k
+    else:
+        W_vals = W_DEFAULT * (1.0 - DECAY_W ** k) / (1.0 - DECAY_W)
+
+    a_out = np.tanh(np.asarray(U_vals) / np.maximum(W_vals, EPS_W))
+
+    # 3. Bands, 4. payload + stamp chain, 5. rows
+    start_epoch = time.time()
+    prev_stamp = b""
+    rows = []
+    bands = classify_band_vec(a_out).tolist()
+    for i, a in enumerate(a_out.tolist()):
+        time_utc = iso_from_epoch(start_epoch + i * tick_sec)
+        time_utc_bytes = time_utc.encode("ascii")
+        band = bands[i]
+        final_align_str = "%+.9f" % a
+        payload_bytes = b"%s|%s|%s" % (
+            time_utc_bytes, final_align_str.encode("ascii"), _BAND_BYTES[band]
+        )
+        prev_stamp = make_stamp(prev_stamp, payload_bytes, time_utc_bytes, hash_fn)
+        stamp = prev_stamp.decode("ascii")
+        rows.append((i + 1, time_utc, final_align_str, band, stamp, tick_ms, tick_ms, 0.0))
+
+    last = rows[-1]
+    print(f"\nlast tick: {last[0]:04d}  {last[1]}  align={last[2]}  band={last[3]}")
+
+    export_rows(rows)
+
 # ---------------------------
 # CLI entrypoint
 # ---------------------------
@@ -351,12 +570,42 @@ def main():
             "If > 0, stops automatically after this many ticks."
         ),
     )
+    parser.add_argument(
+        "--hash",
+        choices=HASH_CHOICES,
+        default=HASH_DEFAULT,
+        help=(
+            f"stamp chain hash (default: {HASH_DEFAULT}). "
+            "Verify with the same --hash; blake3 needs the 'blake3' package."
+        ),
+    )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help=(
+            "simulate --ticks ticks offline on an ideal tick grid with a "
+            "NumPy-vectorised kernel (no sleeping; needs numpy)"
+        ),
+    )
 
     args = parser.parse_args()
     tick_sec = max(args.tick_sec, 0.001)  # avoid absurdly small or negative
     max_ticks = max(args.ticks, 0)
 
-    run_clockke_cli(tick_sec, max_ticks)
+    try:
+        resolve_hash(args.hash)
+    except ValueError as e:
+        parser.error(str(e))
+
+    if args.batch:
+        if np is None:
+            parser.error("--batch needs the 'numpy' package (pip install numpy)")
+        if max_ticks <= 0:
+            parser.error("--batch needs --ticks > 0")
+        run_clockke_cli_batch(max_ticks, tick_sec, args.hash)
+        return
+
+    run_clockke_cli(tick_sec, max_ticks, args.hash)
 
 if __name__ == "__main__":
     main()
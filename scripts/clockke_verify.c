@@ -0,0 +1,302 @@
+/*
+ * clockke_verify.c
+ * Shunyaya Symbolic Mathematical Clock Kernel (SSM-ClockKe)
+ *
+ * Standalone verifier for SHA-256 stamp chains (stamps_clockke.csv),
+ * the same check as clockke_verify_v2_1.py:
+ *     payload  := time_utc|final_align|band
+ *     stamp_k  := sha256(prev_stamp || sha256(payload) || time_utc)
+ * with both digests as lowercase hex text and prev_stamp = "" for the
+ * first row.
+ *
+ * Build:
+ *     gcc -O3 -march=native -flto -o clockke_verify scripts/clockke_verify.c -lcrypto
+ * Usage:
+ *     clockke_verify [stamps_clockke.csv]
+ *
+ * The file is read in 1 MiB blocks and each row is hashed with two
+ * OpenSSL EVP contexts (SHA-NI / ARMv8 SHA when the CPU has them).
+ * Only the result block is printed, in the Python verifier's format.
+ * clockke_verify_v2_1.py runs this binary when it is on PATH.
+ *
+ * Exit status: 0 all checks passed, 1 verification failed,
+ * 2 usage / I/O error, 3 input left to the Python verifier
+ * (quoted fields, missing columns).
+ */
+
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <openssl/evp.h>
+
+#define DEFAULT_CSV "stamps_clockke.csv"
+#define READ_BLOCK (1 << 20)
+#define MAX_FIELDS 64
+
+#define EXIT_PASS 0
+#define EXIT_MISMATCH 1
+#define EXIT_ERROR 2
+#define EXIT_HANDOFF 3
+
+enum { COL_TICK, COL_TIME, COL_ALIGN, COL_BAND, COL_STAMP, N_COLS };
+
+static const char *COL_NAMES[N_COLS] = {
+    "tick_index", "time_utc", "final_align", "band", "stamp"
+};
+
+static const char HEX[] = "0123456789abcdef";
+
+typedef struct {
+    const char *ptr;
+    size_t len;
+} field_t;
+
+typedef struct {
+    int col[N_COLS];        /* field position of each chain column */
+    int need;               /* fields to split per row */
+    int have_header;
+    unsigned char prev[64]; /* stored stamp of the previous row */
+    size_t prev_len;
+    unsigned long long count;
+    EVP_MD_CTX *ctx;
+    const EVP_MD *md;
+} chain_t;
+
+static int is_blank(const char *line, size_t len)
+{
+    for (size_t i = 0; i < len; i++) {
+        switch (line[i]) {
+        case ' ': case '\t': case '\r': case '\n': case '\v': case '\f':
+            continue;
+        default:
+            return 0;
+        }
+    }
+    return 1;
+}
+
+/* Split line on commas into at most max fields; returns the field count. */
+static int split_fields(const char *line, size_t len, field_t *fields, int max)
+{
+    int n = 0;
+    size_t start = 0;
+    while (n < max) {
+        const char *comma = memchr(line + start, ',', len - start);
+        fields[n].ptr = line + start;
+        if (comma == NULL) {
+            fields[n++].len = len - start;
+            break;
+        }
+        fields[n++].len = (size_t)(comma - line) - start;
+        start = (size_t)(comma - line) + 1;
+    }
+    return n;
+}
+
+static void to_hex(const unsigned char *digest, unsigned char *out)
+{
+    for (int i = 0; i < 32; i++) {
+        out[2 * i] = HEX[digest[i] >> 4];
+        out[2 * i + 1] = HEX[digest[i] & 0xF];
+    }
+}
+
+static int read_header(chain_t *ch, const char *line, size_t len)
+{
+    field_t fields[MAX_FIELDS];
+    int n = split_fields(line, len, fields, MAX_FIELDS);
+
+    ch->need = 0;
+    for (int c = 0; c < N_COLS; c++) {
+        ch->col[c] = -1;
+        for (int i = 0; i < n; i++) {
+            if (fields[i].len == strlen(COL_NAMES[c])
+                && memcmp(fields[i].ptr, COL_NAMES[c], fields[i].len) == 0) {
+                ch->col[c] = i;
+                break;
+            }
+        }
+        if (ch->col[c] < 0)
+            return EXIT_HANDOFF;
+        if (ch->col[c] + 1 > ch->need)
+            ch->need = ch->col[c] + 1;
+    }
+    ch->have_header = 1;
+    return EXIT_PASS;
+}
+
+/*
+ * Check one data row. On a mismatch the result block is printed here,
+ * while the row is still in the read buffer.
+ */
+static int verify_line(chain_t *ch, const char *line, size_t len)
+{
+    field_t fields[MAX_FIELDS];
+    unsigned char digest[EVP_MAX_MD_SIZE];
+    unsigned char h_hex[64];
+    unsigned char expected[64];
+    unsigned int dlen;
+    const field_t *time_utc, *align, *band, *stamp;
+    int n = split_fields(line, len, fields, ch->need);
+
+    if (n < ch->need) {
+        /* Too few fields to check: report the row as the mismatch */
+        int t = ch->col[COL_TICK], s = ch->col[COL_STAMP];
+        printf("VERIFICATION FAILED\n");
+        printf("First mismatch at tick_index = %.*s\n",
+               t < n ? (int)fields[t].len : 0, t < n ? fields[t].ptr : "");
+        printf("Stored stamp:   %.*s\n",
+               s < n ? (int)fields[s].len : 0, s < n ? fields[s].ptr : "");
+        printf("Expected stamp: (row has %d of %d fields)\n\n", n, ch->need);
+        return EXIT_MISMATCH;
+    }
+    time_utc = &fields[ch->col[COL_TIME]];
+    align = &fields[ch->col[COL_ALIGN]];
+    band = &fields[ch->col[COL_BAND]];
+    stamp = &fields[ch->col[COL_STAMP]];
+
+    /* inner: sha256(time_utc|final_align|band) as hex */
+    EVP_DigestInit_ex(ch->ctx, ch->md, NULL);
+    EVP_DigestUpdate(ch->ctx, time_utc->ptr, time_utc->len);
+    EVP_DigestUpdate(ch->ctx, "|", 1);
+    EVP_DigestUpdate(ch->ctx, align->ptr, align->len);
+    EVP_DigestUpdate(ch->ctx, "|", 1);
+    EVP_DigestUpdate(ch->ctx, band->ptr, band->len);
+    EVP_DigestFinal_ex(ch->ctx, digest, &dlen);
+    to_hex(digest, h_hex);
+
+    /* outer: sha256(prev_stamp || h_payload || time_utc) as hex */
+    EVP_DigestInit_ex(ch->ctx, ch->md, NULL);
+    EVP_DigestUpdate(ch->ctx, ch->prev, ch->prev_len);
+    EVP_DigestUpdate(ch->ctx, h_hex, 64);
+    EVP_DigestUpdate(ch->ctx, time_utc->ptr, time_utc->len);
+    EVP_DigestFinal_ex(ch->ctx, digest, &dlen);
+    to_hex(digest, expected);
+
+    if (stamp->len != 64 || memcmp(expected, stamp->ptr, 64) != 0) {
+        const field_t *tick = &fields[ch->col[COL_TICK]];
+        printf("VERIFICATION FAILED\n");
+        printf("First mismatch at tick_index = %.*s\n", (int)tick->len, tick->ptr);
+        printf("Stored stamp:   %.*s\n", (int)stamp->len, stamp->ptr);
+        printf("Expected stamp: %.64s\n\n", (const char *)expected);
+        return EXIT_MISMATCH;
+    }
+
+    memcpy(ch->prev, stamp->ptr, 64);
+    ch->prev_len = 64;
+    ch->count++;
+    return EXIT_PASS;
+}
+
+static int process_line(chain_t *ch, const char *line, size_t len)
+{
+    if (len > 0 && line[len - 1] == '\r')
+        len--;
+    if (is_blank(line, len))
+        return EXIT_PASS;
+    if (memchr(line, '"', len) != NULL)
+        return EXIT_HANDOFF;
+    if (!ch->have_header)
+        return read_header(ch, line, len);
+    return verify_line(ch, line, len);
+}
+
+static int verify_stream(chain_t *ch, FILE *f)
+{
+    size_t cap = READ_BLOCK;
+    size_t have = 0;
+    char *buf = malloc(cap);
+    int rc = EXIT_PASS;
+
+    if (buf == NULL) {
+        fprintf(stderr, "clockke_verify: out of memory\n");
+        return EXIT_ERROR;
+    }
+
+    for (;;) {
+        size_t n, pos = 0;
+        int at_eof;
+
+        if (have == cap) {
+            /* A single line longer than the buffer: grow it */
+            char *grown = realloc(buf, cap * 2);
+            if (grown == NULL) {
+                fprintf(stderr, "clockke_verify: out of memory\n");
+                rc = EXIT_ERROR;
+                break;
+            }
+            buf = grown;
+            cap *= 2;
+        }
+        n = fread(buf + have, 1, cap - have, f);
+        if (n == 0 && ferror(f)) {
+            perror("clockke_verify: read");
+            rc = EXIT_ERROR;
+            break;
+        }
+        have += n;
+        at_eof = (n == 0);
+
+        for (;;) {
+            const char *nl = memchr(buf + pos, '\n', have - pos);
+            if (nl == NULL)
+                break;
+            rc = process_line(ch, buf + pos, (size_t)(nl - (buf + pos)));
+            if (rc != EXIT_PASS)
+                goto done;
+            pos = (size_t)(nl - buf) + 1;
+        }
+
+        if (at_eof) {
+            if (pos < have)
+                rc = process_line(ch, buf + pos, have - pos);
+            break;
+        }
+        memmove(buf, buf + pos, have - pos);
+        have -= pos;
+    }
+
+done:
+    free(buf);
+    return rc;
+}
+
+int main(int argc, char **argv)
+{
+    const char *csv_path = DEFAULT_CSV;
+    chain_t ch;
+    FILE *f;
+    int rc;
+
+    if (argc > 2) {
+        fprintf(stderr, "usage: %s [stamps_clockke.csv]\n", argv[0]);
+        return EXIT_ERROR;
+    }
+    if (argc == 2)
+        csv_path = argv[1];
+
+    f = fopen(csv_path, "rb");
+    if (f == NULL) {
+        perror(csv_path);
+        return EXIT_ERROR;
+    }
+
+    memset(&ch, 0, sizeof(ch));
+    ch.md = EVP_sha256();
+    ch.ctx = EVP_MD_CTX_new();
+    if (ch.ctx == NULL) {
+        fprintf(stderr, "clockke_verify: EVP_MD_CTX_new failed\n");
+        fclose(f);
+        return EXIT_ERROR;
+    }
+
+    rc = verify_stream(&ch, f);
+    EVP_MD_CTX_free(ch.ctx);
+    fclose(f);
+
+    if (rc == EXIT_PASS) {
+        printf("ALL CHECKS PASSED\n");
+        printf("Total ticks verified: %llu\n\n", ch.count);
+    }
+    return rc;
+}
@@ -7,69 +7,414 @@ Usage:
     python clockke_verify.py
 or:
     python clockke_verify.py stamps_clockke.csv
+or, for a chain written with clockke_run.py --hash blake2b:
+    python clockke_verify.py stamps_clockke.csv --hash blake2b
+
+SHA-256 chains are handed to the compiled clockke_verify binary
+(clockke_verify.c) when it is on PATH; --no-binary keeps the check here.
 """
 
+import os
 import sys
 import csv
+import mmap
+import shutil
 import hashlib
+import argparse
+import subprocess
+from itertools import islice
+from concurrent.futures import ProcessPoolExecutor
+from binascii import hexlify
+
+try:
+    from blake3 import blake3  # optional, only for --hash blake3
+except ImportError:
+    blake3 = None
+
+try:
+    import ssl  # only for reporting the OpenSSL version
+except ImportError:
+    ssl = None
+
+try:
+    import _clockke_verify  # optional compiled scanner, see _clockke_verify.pyx
+except ImportError:
+    _clockke_verify = None
+
+# Bound once: the verify loop builds two hash objects per row
+_sha256 = hashlib.sha256
 
 DEFAULT_CSV = "stamps_clockke.csv"
 
-def make_stamp(prev_stamp, payload_str, time_utc_str):
+# Compiled verifier built from clockke_verify.c, looked up on PATH
+VERIFY_BINARY = "clockke_verify"
+
+# Rows per batch: inner payload hashes for a chunk are taken before its outer chain
+VERIFY_CHUNK_ROWS = 4096
+
+HASH_DEFAULT = "sha256"
+HASH_CHOICES = ("sha256", "blake2b", "blake3")
+
+def blake2b_256(data=b""):
+    """BLAKE2b with a 32-byte digest, matching clockke_run.py --hash blake2b."""
+    return hashlib.blake2b(data, digest_size=32)
+
+def sha256_backend():
     """
-    Same chain rule as in clockke_run.py:
-    stamp_k := sha256(prev_stamp || sha256(payload_bytes) || time_utc_str)
+    Describe what hashlib.sha256 runs on. OpenSSL >= 1.1.1 picks SHA-NI
+    (x86) or the ARMv8 SHA extensions at runtime when the CPU has them;
+    the builtin fallback is plain C.
+    """
+    if getattr(_sha256, "__name__", "") != "openssl_sha256":
+        return "hashlib builtin (no OpenSSL)"
+    if ssl is None:
+        return "OpenSSL"
+    return ssl.OPENSSL_VERSION
+
+def resolve_hash(name):
+    """
+    Return the hash constructor for a --hash choice.
+    Raises ValueError for unknown names or a missing optional backend.
+    """
+    if name == "sha256":
+        return _sha256
+    if name == "blake2b":
+        return blake2b_256
+    if name == "blake3":
+        if blake3 is None:
+            raise ValueError("--hash blake3 needs the 'blake3' package (pip install blake3)")
+        return blake3
+    raise ValueError(f"unknown hash: {name}")
+
+def inner_digests(payloads, hash_fn=_sha256):
+    """
+    Hex digests H(payload) for a batch of payloads.
+
+    Payload hashes carry no chain dependency, so a whole chunk of rows is
+    hashed here before its serial outer chain runs. A multi-buffer SHA-256
+    backend would plug in at this single call.
+    """
+    return [hexlify(hash_fn(p).digest()) for p in payloads]
+
+def chain_stamp(prev_stamp, h_payload, time_utc_bytes, hash_fn=_sha256):
     """
-    payload_bytes = payload_str.encode("utf-8")
-    h_payload = hashlib.sha256(payload_bytes).hexdigest().encode("utf-8")
-    prev_bytes = (prev_stamp or "").encode("utf-8")
-    time_bytes = time_utc_str.encode("utf-8")
-    raw = prev_bytes + h_payload + time_bytes
-    return hashlib.sha256(raw).hexdigest()
+    Outer chain step: H(prev_stamp || h_payload || time_utc_bytes), as hex bytes.
+    No midstate can be reused: the first block is prev_stamp, new on every row.
+    """
+    h_outer = hash_fn(prev_stamp)
+    h_outer.update(h_payload)
+    h_outer.update(time_utc_bytes)
+    return hexlify(h_outer.digest())
+
+def split_row(line, maxsplit=-1):
+    """
+    One CSV line (bytes) -> list of bytes fields.
+    The writers never quote these columns, so a plain split on b"," is
+    enough (bounded by maxsplit when only the leading fields are needed);
+    a line with quotes (e.g. re-saved by a spreadsheet) goes through the
+    csv module instead.
+    """
+    line = line.rstrip(b"\r\n")
+    if b'"' not in line:
+        return line.split(b",", maxsplit)
+    fields = next(csv.reader([line.decode("utf-8")]))
+    return [field.encode("utf-8") for field in fields]
+
+def map_csv(csv_path):
+    """
+    mmap the CSV read-only; None for an empty file (which cannot be mapped).
+    Lines then come from mm.readline (a memchr scan in C) and fields stay
+    bytes from the file to the hash, with no decode/encode per row.
+    """
+    with open(csv_path, "rb") as f_csv:
+        if not os.fstat(f_csv.fileno()).st_size:
+            return None
+        return mmap.mmap(f_csv.fileno(), 0, access=mmap.ACCESS_READ)
+
+def read_header(mm):
+    """
+    Column positions from the first non-blank line of mm, leaving mm
+    positioned at the first data row. None if there is no header;
+    ValueError if a chain column is missing from it.
+    """
+    names = (b"tick_index", b"time_utc", b"final_align", b"band", b"stamp")
+    for line in iter(mm.readline, b""):
+        if line.strip():
+            header = split_row(line)
+            missing = [name.decode("ascii") for name in names if name not in header]
+            if missing:
+                raise ValueError(f"missing column(s) in CSV header: {', '.join(missing)}")
+            return tuple(header.index(name) for name in names)
+    return None
+
+def iter_lines(mm, end):
+    """Lines of mm from its current position up to byte offset end."""
+    if end >= len(mm):
+        yield from iter(mm.readline, b"")
+        return
+    readline = mm.readline
+    tell = mm.tell
+    while tell() < end:
+        yield readline()
+
+def verify_rows(reader, prev_stamp, cols, hash_fn):
+    """
+    Walk the chain over parsed rows, starting from prev_stamp.
+
+    Returns (rows_verified, mismatch); mismatch is None or
+    (tick_index, stored_stamp, expected_stamp), all bytes; for a row with
+    too few fields expected_stamp says so instead.
+    """
+    i_tick, i_time, i_align, i_band, i_stamp = cols
+    n_fields = max(cols) + 1
+    count = 0
+
+    # Rows are read VERIFY_CHUNK_ROWS at a time: inner payload hashes for
+    # the whole chunk first, then the serial outer chain over the chunk.
+    while True:
+        chunk = list(islice(reader, VERIFY_CHUNK_ROWS))
+        if not chunk:
+            break
+
+        # A row with too few fields cannot be checked: verify the rows
+        # before it, then report it as the mismatch
+        short_row = None
+        if min(map(len, chunk)) < n_fields:
+            k = next(k for k, row in enumerate(chunk) if len(row) < n_fields)
+            chunk, short_row = chunk[:k], chunk[k]
+
+        times = [row[i_time] for row in chunk]
+        payloads = [b"|".join((row[i_time], row[i_align], row[i_band])) for row in chunk]
+
+        h_payloads = inner_digests(payloads, hash_fn)
+
+        # Stamps stay hex bytes: the stored one is the next row's prev_stamp
+        for row, time_utc_bytes, h_payload in zip(chunk, times, h_payloads):
+            stored_stamp = row[i_stamp]
+            expected_stamp = chain_stamp(prev_stamp, h_payload, time_utc_bytes, hash_fn)
+            if expected_stamp != stored_stamp:
+                return count, (row[i_tick], stored_stamp, expected_stamp)
+            prev_stamp = stored_stamp
+            count += 1
+
+        if short_row is not None:
+            tick = short_row[i_tick] if len(short_row) > i_tick else b""
+            stored_stamp = short_row[i_stamp] if len(short_row) > i_stamp else b""
+            return count, (tick, stored_stamp, b"(row has %d of %d fields)" % (len(short_row), n_fields))
+
+    return count, None
+
+def verify_span(mm, start, end, prev_stamp, cols, hash_name):
+    """
+    Verify the rows in mm[start:end] (start and end on line boundaries),
+    chaining from prev_stamp, the stored stamp of the row before start.
+    Returns (rows_verified, mismatch) as verify_rows().
+    """
+    hash_fn = resolve_hash(hash_name)
+    count = 0
+
+    if use_native_scanner(hash_name):
+        # The compiled scanner verifies as far as it can, straight from the
+        # mapping; the Python loop resumes at the row it stopped on
+        # (mismatch, quoting or a short row).
+        with memoryview(mm)[start:end] as body:
+            n_ok, offset, _status, prev_stamp = _clockke_verify.scan(
+                body, prev_stamp, cols[1], cols[2], cols[3], cols[4]
+            )
+        count += n_ok
+        start += offset
+
+    mm.seek(start)
+    n_fields = max(cols) + 1
+    reader = (split_row(line, n_fields) for line in iter_lines(mm, end) if line.strip())
+    n_ok, mismatch = verify_rows(reader, prev_stamp, cols, hash_fn)
+    return count + n_ok, mismatch
+
+def _verify_span_job(csv_path, start, end, prev_stamp, cols, hash_name):
+    """--jobs worker: map the file in this process and verify one span."""
+    mm = map_csv(csv_path)
+    try:
+        return verify_span(mm, start, end, prev_stamp, cols, hash_name)
+    finally:
+        mm.close()
+
+def split_spans(mm, body_start, cols, jobs):
+    """
+    Cut the body mm[body_start:] into up to `jobs` spans on line boundaries.
+
+    Every row is checked against the *stored* stamp of the row before it,
+    so a span only needs that one stamp to start: a byte scan, no hashing.
+    Returns [(start, end, prev_stamp), ...].
+    """
+    size = len(mm)
+    cuts = [body_start]
+    for j in range(1, jobs):
+        nl = mm.find(b"\n", body_start + (size - body_start) * j // jobs)
+        cut = size if nl < 0 else nl + 1
+        if cut > cuts[-1] and cut < size:
+            cuts.append(cut)
+    cuts.append(size)
+
+    spans = []
+    for start, end in zip(cuts, cuts[1:]):
+        prev_stamp = b""
+        # Stored stamp of the last non-blank line before start (none for the first span)
+        pos = start - 1
+        while pos > body_start:
+            line_start = mm.rfind(b"\n", 0, pos) + 1
+            line = mm[line_start:pos]
+            if line.strip():
+                # A short row here is reported by the span before; "" just fails the next
+                fields = split_row(line, max(cols) + 1)
+                if len(fields) > cols[4]:
+                    prev_stamp = fields[cols[4]]
+                break
+            pos = line_start - 1
+        spans.append((start, end, prev_stamp))
+    return spans
+
+def use_native_scanner(hash_name):
+    return _clockke_verify is not None and hash_name == "sha256"
+
+def find_verify_binary(hash_name, jobs):
+    """Path of the clockke_verify binary on PATH if it can take this run, else None."""
+    if hash_name != "sha256" or jobs > 1:
+        return None
+    return shutil.which(VERIFY_BINARY)
+
+def run_verify_binary(binary, csv_path):
+    """
+    Verify csv_path with the compiled binary and return its result block.
+    None if it left the file to this script (exit status 3: quoted
+    fields, missing columns) or failed to run, so the Python path is used.
+    """
+    try:
+        proc = subprocess.run([binary, csv_path], capture_output=True)
+    except OSError:
+        return None
+    if proc.returncode not in (0, 1):
+        return None
+    return proc.stdout.decode("utf-8", "replace")
+
+def verify_file(csv_path, hash_name=HASH_DEFAULT, jobs=1, use_binary=True):
+    binary = find_verify_binary(hash_name, jobs) if use_binary else None
+    binary_result = run_verify_binary(binary, csv_path) if binary else None
 
-def verify_file(csv_path):
     print("")
     print("clockke stamp verifier")
     print(f"Verifying file: {csv_path}")
+    if hash_name != HASH_DEFAULT:
+        print(f"Chain hash: {hash_name}")
+    elif binary_result is not None:
+        print(f"SHA-256 backend: {binary}")
+    elif use_native_scanner(hash_name):
+        print(f"SHA-256 backend: {sha256_backend()} via _clockke_verify")
+    else:
+        print(f"SHA-256 backend: {sha256_backend()}")
+    if jobs > 1:
+        print(f"Jobs: {jobs}")
     print("")
 
-    with open(csv_path, "r", newline="", encoding="utf-8") as f_csv:
-        reader = csv.DictReader(f_csv)
-        prev_stamp = ""
-        count = 0
+    if binary_result is not None:
+        sys.stdout.write(binary_result)
+        return
 
-        for row in reader:
-            tick_index_str = row["tick_index"]
-            time_utc = row["time_utc"]
-            final_align_str = row["final_align"]
-            band = row["band"]
-            stored_stamp = row["stamp"]
+    count = 0
+    mismatch = None
+    cols = None
+    mm = map_csv(csv_path)
+    if mm is not None:
+        try:
+            cols = read_header(mm)
+            if cols is not None:
+                body_start = mm.tell()
+                if jobs > 1:
+                    spans = split_spans(mm, body_start, cols, jobs)
+                else:
+                    spans = [(body_start, len(mm), b"")]
+        except ValueError as e:
+            print("VERIFICATION FAILED")
+            print(f"Cannot verify: {e}")
+            print("")
+            return
+        finally:
+            if jobs > 1 or cols is None:
+                mm.close()
 
-            payload_str = f"{time_utc}|{final_align_str}|{band}"
-            expected_stamp = make_stamp(prev_stamp, payload_str, time_utc)
+        if cols is not None and jobs > 1:
+            with ProcessPoolExecutor(max_workers=jobs) as pool:
+                futures = [
+                    pool.submit(_verify_span_job, csv_path, start, end, prev, cols,
+                                hash_name)
+                    for start, end, prev in spans
+                ]
+                # Spans are merged in file order; the first failing span decides
+                for fut in futures:
+                    n_ok, mismatch = fut.result()
+                    count += n_ok
+                    if mismatch is not None:
+                        for rest in futures:
+                            rest.cancel()
+                        break
+        elif cols is not None:
+            try:
+                start, end, prev = spans[0]
+                count, mismatch = verify_span(mm, start, end, prev, cols, hash_name)
+            finally:
+                mm.close()
 
-            if expected_stamp != stored_stamp:
-                print("VERIFICATION FAILED")
-                print(f"First mismatch at tick_index = {tick_index_str}")
-                print(f"Stored stamp:   {stored_stamp}")
-                print(f"Expected stamp: {expected_stamp}")
-                print("")
-                return
-
-            prev_stamp = stored_stamp
-            count += 1
+    if mismatch is not None:
+        tick_index, stored_stamp, expected_stamp = mismatch
+        print("VERIFICATION FAILED")
+        print(f"First mismatch at tick_index = {tick_index.decode('utf-8', 'replace')}")
+        print(f"Stored stamp:   {stored_stamp.decode('utf-8', 'replace')}")
+        print(f"Expected stamp: {expected_stamp.decode('ascii')}")
+        print("")
+        return
 
     print("ALL CHECKS PASSED")
     print(f"Total ticks verified: {count}")
     print("")
 
 def main():
-    if len(sys.argv) > 1:
-        csv_path = sys.argv[1]
-    else:
-        csv_path = DEFAULT_CSV
+    parser = argparse.ArgumentParser(
+        description="Verify a clockke stamp chain CSV."
+    )
+    parser.add_argument(
+        "csv_path",
+        nargs="?",
+        default=DEFAULT_CSV,
+        help=f"CSV file to verify (default: {DEFAULT_CSV})",
+    )
+    parser.add_argument(
+        "--hash",
+        choices=HASH_CHOICES,
+        default=HASH_DEFAULT,
+        help=f"stamp chain hash used by the writer (default: {HASH_DEFAULT})",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="verify the file in N spans on N worker processes (default: 1)",
+    )
+    parser.add_argument(
+        "--no-binary",
+        action="store_true",
+        help=f"do not hand SHA-256 chains to the compiled {VERIFY_BINARY} binary on PATH",
+    )
+
+    args = parser.parse_args()
+
+    if args.jobs < 1:
+        parser.error("--jobs must be >= 1")
+
+    try:
+        resolve_hash(args.hash)
+    except ValueError as e:
+        parser.error(str(e))
 
-    verify_file(csv_path)
+    verify_file(args.csv_path, args.hash, args.jobs, not args.no_binary)
 
 if __name__ == "__main__":
     main()